@@ -6,19 +6,22 @@ Manages categories, extensions, and exclusions with reduced duplication.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import copy
-from typing import Callable
+from dataclasses import replace
+from typing import Callable, Set, Tuple
 
 from config_models import ConfigManager, SorterConfig
 from ui_components import (
     ListboxManager, ValidationHelper, InputDialog,
-    DialogPositioner, safe_gui_operation
+    DialogPositioner, safe_gui_operation, ensure_styles
 )
 
 
 class CategoryEditor(tk.Toplevel):
     """Category and exclusion editor dialog - refactored version."""
     
+    # Coalesce <<ListboxSelect>> bursts (arrow-key scrolling) into one refresh
+    SELECT_DELAY_MS = 30
+    
     def __init__(self, parent, config_manager: ConfigManager, 
                  current_config: SorterConfig, translator_func: Callable):
         super().__init__(parent)
@@ -29,13 +32,25 @@ class CategoryEditor(tk.Toplevel):
         # Configuration
         self.config_manager = config_manager
         self.original_config = current_config
-        self.edited_config = copy.deepcopy(current_config)
+        # Copy-on-write: extension lists stay shared with the original
+        # until a category is first edited; edited categories hold a set
+        # (see _editable_extensions)
+        self.edited_config = replace(
+            current_config,
+            categories=dict(current_config.categories),
+            excluded_extensions=set(current_config.excluded_extensions),
+            excluded_folders=set(current_config.excluded_folders)
+        )
+        self._owned_categories = set()
         
         # UI managers
         self.category_manager = None
         self.extension_manager = None
         self.exclusion_manager = None
         self.folder_exclusion_manager = None
+        self._pending_select = None
+        self._shown_category = None
+        self._tr_cache = {}
         
         # Setup
         self._setup_window()
@@ -52,6 +67,14 @@ class CategoryEditor(tk.Toplevel):
         
         self.wait_window()
     
+    def _t(self, key: str, default=None, **kwargs) -> str:
+        """Translate with a per-dialog memo (the language cannot change while open)."""
+        cache_key = (key, default, tuple(sorted(kwargs.items())))
+        text = self._tr_cache.get(cache_key)
+        if text is None:
+            text = self._tr_cache[cache_key] = self._(key, default=default, **kwargs)
+        return text
+    
     def _setup_window(self):
         """Configure window properties."""
         self.title(self._("CategoryEditorTitle", default="Kategorien & Ausschlüsse bearbeiten"))
@@ -64,10 +87,15 @@ class CategoryEditor(tk.Toplevel):
         # Notebook for tabs
         self.notebook = ttk.Notebook(self)
         
-        # Create tabs
+        # Create tabs; the exclusion tabs are filled when first shown
         self.category_tab = self._create_category_tab()
-        self.exclusion_tab = self._create_exclusion_tab()
-        self.folder_tab = self._create_folder_exclusion_tab()
+        self.exclusion_tab = ttk.Frame(self.notebook, padding="10")
+        self.folder_tab = ttk.Frame(self.notebook, padding="10")
+        self._tab_builders = {
+            str(self.exclusion_tab): self._build_exclusion_tab,
+            str(self.folder_tab): self._build_folder_exclusion_tab
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Add tabs to notebook
         self.notebook.add(
@@ -132,7 +160,7 @@ class CategoryEditor(tk.Toplevel):
         # Extension list
         self.extension_label = ttk.Label(
             frame,
-            text=self._("ExtensionListLabel", default="Endungen für: {category}", category='-')
+            text=self._t("ExtensionListLabel", default="Endungen für: {category}", category='-')
         )
         self.extension_label.grid(row=0, column=1, sticky="w", pady=(0,2))
         
@@ -159,13 +187,13 @@ class CategoryEditor(tk.Toplevel):
         
         ttk.Button(
             ext_input_frame,
-            text=self._("AddButtonShort", default="Add"),
+            text=self._t("AddButtonShort", default="Add"),
             command=self._add_extension
         ).pack(side=tk.LEFT, padx=2)
         
         ttk.Button(
             ext_input_frame,
-            text=self._("RemoveButton"),
+            text=self._t("RemoveButton"),
             command=self._remove_extension
         ).pack(side=tk.LEFT, padx=2)
         
@@ -175,101 +203,86 @@ class CategoryEditor(tk.Toplevel):
         
         return frame
     
-    def _create_exclusion_tab(self):
-        """Create the extension exclusions tab."""
-        frame = ttk.Frame(self.notebook, padding="10")
-        frame.columnconfigure(0, weight=1)
-        frame.rowconfigure(1, weight=1)
-        
-        # List
-        ttk.Label(frame, text=self._("ExclusionListLabel", default="Ausgeschl. Endungen:")
-        ).grid(row=0, column=0, sticky="w", pady=(0,2))
-        
-        list_frame = ttk.Frame(frame)
-        list_frame.grid(row=1, column=0, sticky="nsew", pady=(0,5))
-        
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
-        self.exclusion_listbox = tk.Listbox(
-            list_frame,
-            exportselection=False,
-            yscrollcommand=scrollbar.set
+    def _on_tab_changed(self, event):
+        """Build a tab's widgets the first time it is selected."""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+    
+    def _build_exclusion_tab(self):
+        """Build and fill the extension exclusions tab."""
+        self.exclusion_listbox, self.exclusion_entry = self._build_list_tab(
+            self.exclusion_tab,
+            self._("ExclusionListLabel", default="Ausgeschl. Endungen:"),
+            self._add_exclusion,
+            self._remove_exclusion
         )
-        scrollbar.config(command=self.exclusion_listbox.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.exclusion_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Input
-        input_frame = ttk.Frame(frame)
-        input_frame.grid(row=2, column=0, sticky="ew")
-        
-        self.exclusion_entry = ttk.Entry(input_frame)
-        self.exclusion_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        self.exclusion_entry.bind("<Return>", lambda e: self._add_exclusion())
-        
-        ttk.Button(
-            input_frame,
-            text=self._("AddButtonShort", default="Add"),
-            command=self._add_exclusion
-        ).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(
-            input_frame,
-            text=self._("RemoveButton"),
-            command=self._remove_exclusion
-        ).pack(side=tk.LEFT, padx=2)
         
         # Initialize manager
         self.exclusion_manager = ListboxManager(self.exclusion_listbox)
+        self.exclusion_manager.populate(self.edited_config.excluded_extensions)
+    
+    def _build_folder_exclusion_tab(self):
+        """Build and fill the folder exclusions tab."""
+        self.folder_listbox, self.folder_entry = self._build_list_tab(
+            self.folder_tab,
+            self._("FolderExclusionListLabel", default="Ignorierte Ordner:"),
+            self._add_folder_exclusion,
+            self._remove_folder_exclusion
+        )
         
-        return frame
+        # Initialize manager
+        self.folder_exclusion_manager = ListboxManager(self.folder_listbox)
+        self.folder_exclusion_manager.populate(self.edited_config.excluded_folders)
     
-    def _create_folder_exclusion_tab(self):
-        """Create the folder exclusions tab."""
-        frame = ttk.Frame(self.notebook, padding="10")
+    def _build_list_tab(self, frame: ttk.Frame, label_text: str,
+                        add_command: Callable, remove_command: Callable) -> Tuple[tk.Listbox, ttk.Entry]:
+        """
+        Build a "list + entry + Add/Remove" tab layout into frame.
+        
+        Returns:
+            (listbox, entry)
+        """
         frame.columnconfigure(0, weight=1)
         frame.rowconfigure(1, weight=1)
         
         # List
-        ttk.Label(frame, text=self._("FolderExclusionListLabel", default="Ignorierte Ordner:")
-        ).grid(row=0, column=0, sticky="w", pady=(0,2))
+        ttk.Label(frame, text=label_text).grid(row=0, column=0, sticky="w", pady=(0,2))
         
         list_frame = ttk.Frame(frame)
         list_frame.grid(row=1, column=0, sticky="nsew", pady=(0,5))
         
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
-        self.folder_listbox = tk.Listbox(
+        listbox = tk.Listbox(
             list_frame,
             exportselection=False,
             yscrollcommand=scrollbar.set
         )
-        scrollbar.config(command=self.folder_listbox.yview)
+        scrollbar.config(command=listbox.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.folder_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Input
         input_frame = ttk.Frame(frame)
         input_frame.grid(row=2, column=0, sticky="ew")
         
-        self.folder_entry = ttk.Entry(input_frame)
-        self.folder_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        self.folder_entry.bind("<Return>", lambda e: self._add_folder_exclusion())
+        entry = ttk.Entry(input_frame)
+        entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        entry.bind("<Return>", lambda e: add_command())
         
         ttk.Button(
             input_frame,
-            text=self._("AddButtonShort", default="Add"),
-            command=self._add_folder_exclusion
+            text=self._t("AddButtonShort", default="Add"),
+            command=add_command
         ).pack(side=tk.LEFT, padx=2)
         
         ttk.Button(
             input_frame,
-            text=self._("RemoveButton"),
-            command=self._remove_folder_exclusion
+            text=self._t("RemoveButton"),
+            command=remove_command
         ).pack(side=tk.LEFT, padx=2)
         
-        # Initialize manager
-        self.folder_exclusion_manager = ListboxManager(self.folder_listbox)
-        
-        return frame
+        return listbox, entry
     
     def _create_button_frame(self):
         """Create the bottom button frame."""
@@ -292,39 +305,40 @@ class CategoryEditor(tk.Toplevel):
             command=self.cancel_changes
         ).pack(side=tk.RIGHT)
         
-        # Style
-        style = ttk.Style()
-        style.configure("Accent.TButton", foreground="white", background="#0078D7")
+        ensure_styles()
     
     def _populate_initial_data(self):
-        """Populate all lists with initial data."""
+        """Populate the category lists (exclusion tabs fill themselves when shown)."""
         # Categories
-        self.category_manager.populate(list(self.edited_config.categories.keys()))
+        self.category_manager.populate(self.edited_config.categories)
         if self.category_listbox.size() > 0:
             self.category_listbox.select_set(0)
-            self._on_category_select(None)
-        
-        # Exclusions
-        self.exclusion_manager.populate(list(self.edited_config.excluded_extensions))
-        self.folder_exclusion_manager.populate(list(self.edited_config.excluded_folders))
+            self._show_selected_category()
     
     def _on_category_select(self, event):
-        """Handle category selection."""
+        """Handle category selection (refresh once the selection settles)."""
+        if self._pending_select is None:
+            self._pending_select = self.after(self.SELECT_DELAY_MS, self._show_selected_category)
+    
+    def _show_selected_category(self):
+        """Show the extensions of the selected category."""
+        if self._pending_select is not None:
+            # Called directly while a delayed refresh is pending: apply it now
+            self.after_cancel(self._pending_select)
+            self._pending_select = None
         selected = self.category_manager.get_selected()
+        if selected == self._shown_category:
+            return  # Re-selecting the shown category; the list is current
+        self._shown_category = selected
         
-        if selected:
-            self.extension_label.config(
-                text=self._("ExtensionListLabel", default="Endungen für: {category}", 
-                          category=selected)
-            )
-            extensions = self.edited_config.categories.get(selected, [])
-            self.extension_manager.populate(extensions)
-        else:
-            self.extension_label.config(
-                text=self._("ExtensionListLabel", default="Endungen für: {category}", 
-                          category='-')
-            )
-            self.extension_manager.populate([])
+        self.extension_label.config(
+            text=self._t("ExtensionListLabel", default="Endungen für: {category}", 
+                       category=selected or '-')
+        )
+        
+        # Each category's list starts unselected, no need to ask Tk for the old selection
+        extensions = self.edited_config.categories.get(selected, []) if selected else []
+        self.extension_manager.populate(extensions, keep_selection=False)
     
     def _add_category(self):
         """Add a new category."""
@@ -340,22 +354,32 @@ class CategoryEditor(tk.Toplevel):
             
             if not new_category:
                 messagebox.showwarning(
-                    self._("InvalidNameWarningTitle", default="Ungültiger Name"),
+                    self._t("InvalidNameWarningTitle", default="Ungültiger Name"),
                     self._("InvalidNameWarningMsg", default="Name leer."),
                     parent=self
                 )
                 return
             
+            # Category names become folder names
+            if ValidationHelper.has_path_separator(new_category):
+                messagebox.showwarning(
+                    self._t("InvalidNameWarningTitle", default="Ungültiger Name"),
+                    self._("InvalidFolderNameWarningMsg", default="Ordnername darf keine Pfadtrenner enthalten."),
+                    parent=self
+                )
+                return
+            
             if new_category in self.edited_config.categories:
                 messagebox.showwarning(
-                    self._("DuplicateNameWarningTitle", default="Doppelter Name"),
+                    self._t("DuplicateNameWarningTitle", default="Doppelter Name"),
                     self._("DuplicateNameWarningMsg", default="Existiert.", name=new_category),
                     parent=self
                 )
             else:
-                self.edited_config.categories[new_category] = []
+                self.edited_config.categories[new_category] = set()
+                self._owned_categories.add(new_category)
                 self.category_manager.add_item(new_category)
-                self._on_category_select(None)
+                self._show_selected_category()
     
     def _remove_category(self):
         """Remove selected category."""
@@ -363,29 +387,31 @@ class CategoryEditor(tk.Toplevel):
         
         if not selected:
             messagebox.showwarning(
-                self._("NoSelectionWarningTitle"),
+                self._t("NoSelectionWarningTitle"),
                 self._("NoCategorySelectedMsg"),
                 parent=self
             )
             return
         
         if messagebox.askyesno(
-            self._("ConfirmRemoveTitle"),
+            self._t("ConfirmRemoveTitle"),
             self._("ConfirmRemoveCategoryMsg", category=selected),
             icon='warning',
             parent=self
         ):
             del self.edited_config.categories[selected]
             self.category_manager.remove_selected()
-            self._on_category_select(None)
+            self._show_selected_category()
     
     def _add_extension(self):
         """Add extension to selected category."""
+        # Apply a pending selection refresh, so the list matches the category
+        self._show_selected_category()
         selected_category = self.category_manager.get_selected()
         
         if not selected_category:
             messagebox.showwarning(
-                self._("NoSelectionWarningTitle"),
+                self._t("NoSelectionWarningTitle"),
                 self._("NoCategorySelectedMsg"),
                 parent=self
             )
@@ -397,48 +423,58 @@ class CategoryEditor(tk.Toplevel):
         
         if not is_valid:
             messagebox.showwarning(
-                self._("InvalidExtensionWarningTitle"),
+                self._t("InvalidExtensionWarningTitle"),
                 error_msg,
                 parent=self
             )
             return
         
         # Check if already exists
-        if cleaned_ext in self.edited_config.categories[selected_category]:
+        extensions = self._editable_extensions(selected_category)
+        if cleaned_ext in extensions:
             messagebox.showwarning(
-                self._("DuplicateNameWarningTitle"),
+                self._t("DuplicateNameWarningTitle"),
                 self._("DuplicateExtensionExistsInCategoryMsg",
                       default="Endung '{ext}' existiert bereits in Kat. '{category}'.",
                       ext=cleaned_ext, category=selected_category),
                 parent=self
             )
         else:
-            self.edited_config.categories[selected_category].append(cleaned_ext)
+            extensions.add(cleaned_ext)
             self.extension_manager.add_item(cleaned_ext)
             self.extension_entry.delete(0, tk.END)
     
     def _remove_extension(self):
         """Remove selected extension."""
+        # Apply a pending selection refresh, so the list matches the category
+        self._show_selected_category()
         selected_category = self.category_manager.get_selected()
         selected_extension = self.extension_manager.get_selected()
         
         if not selected_category or not selected_extension:
             messagebox.showwarning(
-                self._("NoSelectionWarningTitle"),
+                self._t("NoSelectionWarningTitle"),
                 self._("NoCatOrExtSelectedMsg", default="Kategorie und Endung auswählen."),
                 parent=self
             )
             return
         
         if messagebox.askyesno(
-            self._("ConfirmRemoveTitle"),
+            self._t("ConfirmRemoveTitle"),
             self._("ConfirmRemoveExtensionMsg",
                   ext=selected_extension, category=selected_category),
             parent=self
         ):
-            self.edited_config.categories[selected_category].remove(selected_extension)
+            self._editable_extensions(selected_category).remove(selected_extension)
             self.extension_manager.remove_selected()
     
+    def _editable_extensions(self, category: str) -> Set[str]:
+        """Return the category's extensions as a set, copying them on first change."""
+        if category not in self._owned_categories:
+            self.edited_config.categories[category] = set(self.edited_config.categories[category])
+            self._owned_categories.add(category)
+        return self.edited_config.categories[category]
+    
     def _add_exclusion(self):
         """Add extension exclusion."""
         ext_input = self.exclusion_entry.get()
@@ -446,7 +482,7 @@ class CategoryEditor(tk.Toplevel):
         
         if not is_valid:
             messagebox.showwarning(
-                self._("InvalidExtensionWarningTitle"),
+                self._t("InvalidExtensionWarningTitle"),
                 error_msg,
                 parent=self
             )
@@ -458,7 +494,7 @@ class CategoryEditor(tk.Toplevel):
             self.exclusion_entry.delete(0, tk.END)
         else:
             messagebox.showinfo(
-                self._("DuplicateNameWarningTitle"),
+                self._t("DuplicateNameWarningTitle"),
                 self._("AlreadyExcludedExtensionMsg", ext=cleaned_ext),
                 parent=self
             )
@@ -469,14 +505,14 @@ class CategoryEditor(tk.Toplevel):
         
         if not selected:
             messagebox.showwarning(
-                self._("NoSelectionWarningTitle"),
+                self._t("NoSelectionWarningTitle"),
                 self._("NoExclusionSelectedMsg"),
                 parent=self
             )
             return
         
         if messagebox.askyesno(
-            self._("ConfirmRemoveTitle"),
+            self._t("ConfirmRemoveTitle"),
             self._("ConfirmRemoveExclusionMsg", ext=selected),
             parent=self
         ):
@@ -492,7 +528,7 @@ class CategoryEditor(tk.Toplevel):
         
         if not is_valid:
             messagebox.showwarning(
-                self._("InvalidNameWarningTitle"),
+                self._t("InvalidNameWarningTitle"),
                 error_msg,
                 parent=self
             )
@@ -504,7 +540,7 @@ class CategoryEditor(tk.Toplevel):
             self.folder_entry.delete(0, tk.END)
         else:
             messagebox.showinfo(
-                self._("DuplicateNameWarningTitle"),
+                self._t("DuplicateNameWarningTitle"),
                 self._("AlreadyExcludedFolderMsg", folder=cleaned_folder),
                 parent=self
             )
@@ -515,14 +551,14 @@ class CategoryEditor(tk.Toplevel):
         
         if not selected:
             messagebox.showwarning(
-                self._("NoSelectionWarningTitle"),
+                self._t("NoSelectionWarningTitle"),
                 self._("NoFolderExclusionSelectedMsg"),
                 parent=self
             )
             return
         
         if messagebox.askyesno(
-            self._("ConfirmRemoveTitle"),
+            self._t("ConfirmRemoveTitle"),
             self._("ConfirmRemoveFolderExclusionMsg", folder=selected),
             parent=self
         ):
@@ -532,9 +568,24 @@ class CategoryEditor(tk.Toplevel):
     def save_changes(self):
         """Save configuration changes."""
         with safe_gui_operation(self, "SaveConfig", self._):
-            if self.config_manager.save_config(self.edited_config):
+            if self.config_manager.save_config(self._config_to_save()):
                 self.destroy()
     
+    def _config_to_save(self) -> SorterConfig:
+        """Return the edited config with extension sets turned back into lists."""
+        categories = {
+            name: sorted(extensions) if isinstance(extensions, set) else extensions
+            for name, extensions in self.edited_config.categories.items()
+        }
+        return replace(self.edited_config, categories=categories)
+    
     def cancel_changes(self):
         """Cancel without saving."""
-        self.destroy()
\ No newline at end of file
+        self.destroy()
+    
+    def destroy(self):
+        """Drop a pending selection refresh before closing."""
+        if self._pending_select is not None:
+            self.after_cancel(self._pending_select)
+            self._pending_select = None
+        super().destroy()
\ No newline at end of file
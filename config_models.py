@@ -6,8 +6,11 @@ Provides type-safe configuration management using dataclasses.
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Set
+import hashlib
 import json
 import os
+import pickle
+import sys
 
 
 @dataclass
@@ -17,6 +20,10 @@ class SorterConfig:
     default_category: str = "_Unsortiert"
     excluded_extensions: Set[str] = field(default_factory=set)
     excluded_folders: Set[str] = field(default_factory=set)
+    # Copy permissions/xattrs too (copystat); otherwise only the timestamps
+    preserve_metadata: bool = False
+    # Concurrent copy/move operations; 0 = FileSorter default
+    parallel_copies: int = 0
     
     @classmethod
     def from_dict(cls, data: dict) -> 'SorterConfig':
@@ -25,7 +32,13 @@ class SorterConfig:
             categories=data.get("Kategorien", {}),
             default_category=data.get("StandardKategorie", "_Unsortiert"),
             excluded_extensions=set(data.get("AusgeschlosseneEndungen", [])),
-            excluded_folders=set(data.get("AusgeschlosseneOrdner", []))
+            excluded_folders=set(data.get("AusgeschlosseneOrdner", [])),
+            preserve_metadata=ConfigValidator.validate_preserve_metadata(
+                data.get("MetadatenErhalten", False)
+            ),
+            parallel_copies=ConfigValidator.validate_parallel_copies(
+                data.get("ParalleleKopien", 0)
+            )
         )
     
     def to_dict(self) -> dict:
@@ -33,22 +46,65 @@ class SorterConfig:
         return {
             "Kategorien": self.categories,
             "StandardKategorie": self.default_category,
-            "AusgeschlosseneEndungen": sorted(list(self.excluded_extensions)),
-            "AusgeschlosseneOrdner": sorted(list(self.excluded_folders))
+            "AusgeschlosseneEndungen": sorted(self.excluded_extensions),
+            "AusgeschlosseneOrdner": sorted(self.excluded_folders),
+            "MetadatenErhalten": self.preserve_metadata,
+            "ParalleleKopien": self.parallel_copies
         }
     
-    def build_extension_map(self) -> Dict[str, str]:
-        """Build a mapping from extensions to categories."""
-        extension_map = {}
-        for category, extensions in self.categories.items():
-            for ext in extensions:
-                if isinstance(ext, str) and ext.startswith('.'):
-                    extension_map[ext.lower()] = category
+    def copy(self) -> 'SorterConfig':
+        """Return an independent copy (containers are copied, strings shared)."""
+        return SorterConfig(
+            categories={name: list(exts) for name, exts in self.categories.items()},
+            default_category=self.default_category,
+            excluded_extensions=set(self.excluded_extensions),
+            excluded_folders=set(self.excluded_folders),
+            preserve_metadata=self.preserve_metadata,
+            parallel_copies=self.parallel_copies
+        )
+    
+    def build_extension_map(self, logger=None) -> Dict[str, str]:
+        """
+        Build a mapping from extensions to categories.
+        An extension listed in several categories maps to the last one;
+        with a logger, such duplicates are reported.
+        """
+        is_extension = ConfigValidator._is_extension
+        extension_map = {
+            ext.lower(): category
+            for category, extensions in self.categories.items()
+            for ext in extensions if is_extension(ext)
+        }
+        
+        # Duplicates are only looked for when the map came out smaller
+        if logger:
+            valid_count = sum(
+                1 for extensions in self.categories.values() for ext in extensions if is_extension(ext)
+            )
+            if len(extension_map) != valid_count:
+                seen = set()
+                for extensions in self.categories.values():
+                    for ext in extensions:
+                        if is_extension(ext):
+                            ext = ext.lower()
+                            if ext in seen:
+                                logger(f"Warnung: Endung '{ext}' mehrfach zugeordnet, "
+                                       f"verwende '{extension_map[ext]}'.")
+                            seen.add(ext)
         return extension_map
 
 
 class ConfigValidator:
-    """Validates and sanitizes configuration data."""
+    """
+    Validates and sanitizes configuration data.
+    Each list is filtered in one comprehension; invalid entries are only
+    looked for (and logged) when the filter actually dropped some.
+    """
+    
+    @staticmethod
+    def _is_extension(ext) -> bool:
+        """True for strings like '.jpg' (dot plus at least one character)."""
+        return isinstance(ext, str) and len(ext) > 1 and ext[0] == '.'
     
     @staticmethod
     def validate_categories(categories: dict, logger=None) -> Dict[str, List[str]]:
@@ -60,18 +116,18 @@ class ConfigValidator:
                 logger("FEHLER: 'Kategorien' kein Dictionary.")
             return {}
         
+        is_extension = ConfigValidator._is_extension
         for category, extensions in categories.items():
             if not isinstance(extensions, list):
                 if logger:
                     logger(f"Warnung: Ungültiges Format für Extensions in Kat. '{category}'")
                 continue
-                
-            valid_extensions = []
-            for ext in extensions:
-                if isinstance(ext, str) and ext.startswith('.') and len(ext) > 1:
-                    valid_extensions.append(ext.lower())
-                elif logger:
-                    logger(f"Warnung: Ignoriere ungültige Endung '{ext}' in Kat '{category}'.")
+            
+            valid_extensions = [ext.lower() for ext in extensions if is_extension(ext)]
+            if logger and len(valid_extensions) != len(extensions):
+                for ext in extensions:
+                    if not is_extension(ext):
+                        logger(f"Warnung: Ignoriere ungültige Endung '{ext}' in Kat '{category}'.")
             
             if valid_extensions:
                 validated[category] = valid_extensions
@@ -81,54 +137,135 @@ class ConfigValidator:
     @staticmethod
     def validate_extensions(extensions: list, logger=None) -> Set[str]:
         """Validate file extensions."""
-        validated = set()
-        
         if not isinstance(extensions, list):
             if logger:
                 logger("Warnung: 'AusgeschlosseneEndungen' keine Liste.")
             return set()
         
-        for ext in extensions:
-            if isinstance(ext, str) and ext.startswith('.') and len(ext) > 1:
-                validated.add(ext.lower())
-            elif logger:
-                logger(f"Warnung: Ignoriere ungültige Ausschlusserweiterung '{ext}'.")
+        is_extension = ConfigValidator._is_extension
+        valid = [ext.lower() for ext in extensions if is_extension(ext)]
+        if logger and len(valid) != len(extensions):
+            for ext in extensions:
+                if not is_extension(ext):
+                    logger(f"Warnung: Ignoriere ungültige Ausschlusserweiterung '{ext}'.")
                 
-        return validated
+        return set(valid)
     
     @staticmethod
     def validate_folders(folders: list, logger=None) -> Set[str]:
         """Validate folder names."""
-        validated = set()
-        
         if not isinstance(folders, list):
             if logger:
                 logger("Warnung: 'AusgeschlosseneOrdner' keine Liste.")
             return set()
         
-        for folder in folders:
-            if isinstance(folder, str) and folder.strip():
-                validated.add(folder.strip().lower())
-            elif logger:
-                logger(f"Warnung: Ignoriere ungültigen Ordnerausschluss '{folder}'.")
+        valid = [
+            stripped.lower() for folder in folders
+            if isinstance(folder, str) and (stripped := folder.strip())
+        ]
+        if logger and len(valid) != len(folders):
+            for folder in folders:
+                if not (isinstance(folder, str) and folder.strip()):
+                    logger(f"Warnung: Ignoriere ungültigen Ordnerausschluss '{folder}'.")
                 
-        return validated
+        return set(valid)
+    
+    @staticmethod
+    def validate_preserve_metadata(value, logger=None) -> bool:
+        """Validate 'MetadatenErhalten' (a JSON boolean; anything else means False)."""
+        if not isinstance(value, bool):
+            if logger:
+                logger("Warnung: 'MetadatenErhalten' kein Boolean, verwende false.")
+            return False
+        return value
+    
+    @staticmethod
+    def validate_parallel_copies(value, logger=None) -> int:
+        """Validate 'ParalleleKopien' (an integer >= 0; anything else means 0 = automatic)."""
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            if logger:
+                logger("Warnung: 'ParalleleKopien' keine Zahl >= 0, verwende 0 (automatisch).")
+            return 0
+        return value
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Unpickler for the compiled config cache: SorterConfig is the only class it builds."""
+    
+    def find_class(self, module, name):
+        if module == SorterConfig.__module__ and name == "SorterConfig":
+            return SorterConfig
+        raise pickle.UnpicklingError(f"{module}.{name} nicht erlaubt")
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory of the application (not created here)."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'Dateiexperte')
 
 
 class ConfigManager:
     """Manages loading and saving configuration."""
     
+    CACHE_SUFFIX = ".cache.pkl"
+    # Part of the cache key; bump whenever validation or SorterConfig fields change
+    CACHE_FORMAT = 2
+    
     def __init__(self, config_file: str, logger=None):
         self.config_file = config_file
+        # One cache file per config path, in the user's cache directory
+        config_id = hashlib.sha256(os.path.abspath(config_file).encode('utf-8')).hexdigest()[:16]
+        self.cache_file = os.path.join(_user_cache_dir(), config_id + self.CACHE_SUFFIX)
         self.logger = logger or print
         self.validator = ConfigValidator()
+        
+        # Last validated config and its validation warnings,
+        # keyed by (CACHE_FORMAT, mtime, size) of the file
+        self._cache_version = None
+        self._cached_config = None
+        self._cached_warnings = []
     
     def load_config(self) -> SorterConfig:
-        """Load configuration from file."""
+        """Load configuration from file (reused while the file is unchanged)."""
+        try:
+            st = os.stat(self.config_file)
+            version = (self.CACHE_FORMAT, st.st_mtime_ns, st.st_size)
+        except OSError:
+            version = None
+        
+        if version is not None:
+            if version == self._cache_version:
+                self._replay(self._cached_warnings)
+                return self._cached_config.copy()
+            
+            cached = self._load_compiled_cache(version)
+            if cached is not None:
+                config, warnings = cached
+                self._replay(warnings)
+                self._remember(version, config, warnings)
+                return config
+        
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return self._validate_config_data(data)
+            
+            # Keep the validation warnings, so cache hits can show them again
+            warnings = []
+            
+            def log(message):
+                warnings.append(message)
+                self.logger(message)
+            
+            config = self._validate_config_data(data, log)
+            if version is not None:
+                self._remember(version, config, warnings)
+                self._write_compiled_cache(version, config, warnings)
+            return config
         except FileNotFoundError:
             self.logger(f"'{os.path.basename(self.config_file)}' nicht gefunden. Erstelle Standard...")
             return self.create_default_config()
@@ -141,7 +278,10 @@ class ConfigManager:
     
     def save_config(self, config: SorterConfig) -> bool:
         """Save configuration to file."""
+        # The next load must re-validate what was written
+        self._cache_version = None
         try:
+            # Same layout on every machine (no optional writer with its own indentation)
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config.to_dict(), f, indent=4, ensure_ascii=False)
             return True
@@ -149,6 +289,76 @@ class ConfigManager:
             self.logger(f"FEHLER Speichern Config: {e}")
             return False
     
+    def _remember(self, version: tuple, config: SorterConfig, warnings: List[str]) -> None:
+        """Keep a private copy of the validated config for this file version."""
+        self._cache_version = version
+        self._cached_config = config.copy()
+        self._cached_warnings = list(warnings)
+    
+    def _replay(self, warnings: List[str]) -> None:
+        """Log the validation warnings of a cached config again."""
+        for message in warnings:
+            self.logger(message)
+    
+    def _load_compiled_cache(self, version: tuple):
+        """
+        Return (config, warnings) from the compiled cache if it matches this
+        file version. Only SorterConfig can be unpickled, the cache must be
+        owned by and writable only for the current user, and every field is
+        type-checked; anything else counts as a stale cache.
+        """
+        try:
+            with open(self.cache_file, 'rb') as f:
+                if hasattr(os, 'getuid'):
+                    st = os.fstat(f.fileno())
+                    if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                        return None
+                cached = _CacheUnpickler(f).load()
+            if (isinstance(cached, dict) and cached.get("version") == version
+                    and self._is_valid_cached(cached.get("config"))
+                    and isinstance(cached.get("warnings"), list)
+                    and all(isinstance(message, str) for message in cached["warnings"])):
+                return cached["config"], cached["warnings"]
+        except Exception:
+            pass  # Missing, stale or unreadable cache: parse the JSON
+        return None
+    
+    @staticmethod
+    def _is_valid_cached(config) -> bool:
+        """Type-check an unpickled config (BUILD may have set anything)."""
+        def strings(values):
+            return all(isinstance(value, str) for value in values)
+        
+        return (
+            type(config) is SorterConfig
+            and set(vars(config)) == set(SorterConfig.__dataclass_fields__)
+            and isinstance(config.categories, dict)
+            and strings(config.categories)
+            and all(isinstance(exts, list) and strings(exts) for exts in config.categories.values())
+            and isinstance(config.default_category, str)
+            and isinstance(config.excluded_extensions, set) and strings(config.excluded_extensions)
+            and isinstance(config.excluded_folders, set) and strings(config.excluded_folders)
+            and isinstance(config.preserve_metadata, bool)
+            and type(config.parallel_copies) is int and config.parallel_copies >= 0
+        )
+    
+    def _write_compiled_cache(self, version: tuple, config: SorterConfig, warnings: List[str]) -> None:
+        """Persist the validated config in the user's cache directory (best effort)."""
+        temp_file = self.cache_file + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), mode=0o700, exist_ok=True)
+            with open(temp_file, 'wb') as f:
+                pickle.dump(
+                    {"version": version, "config": config, "warnings": list(warnings)},
+                    f, pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(temp_file, self.cache_file)
+        except Exception:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+    
     def create_default_config(self) -> SorterConfig:
         """Create and save default configuration."""
         default_config = SorterConfig(
@@ -170,38 +380,51 @@ class ConfigManager:
         else:
             return SorterConfig()
     
-    def _validate_config_data(self, data: dict) -> SorterConfig:
-        """Validate loaded configuration data."""
+    def _validate_config_data(self, data: dict, logger=None) -> SorterConfig:
+        """Validate loaded configuration data (warnings go to logger, default self.logger)."""
+        logger = logger or self.logger
         if not isinstance(data, dict):
-            self.logger("Konfigformat ungültig. Verwende Defaults.")
+            logger("Konfigformat ungültig. Verwende Defaults.")
             return SorterConfig()
         
         # Validate categories
         categories = self.validator.validate_categories(
             data.get("Kategorien", {}), 
-            self.logger
+            logger
         )
         
         # Validate default category
         default_category = data.get("StandardKategorie", "_Unsortiert")
         if not isinstance(default_category, str) or not default_category.strip():
             default_category = "_Unsortiert"
-            self.logger("Warnung: StandardKategorie leer, verwende '_Unsortiert'.")
+            logger("Warnung: StandardKategorie leer, verwende '_Unsortiert'.")
         
         # Validate exclusions
         excluded_extensions = self.validator.validate_extensions(
             data.get("AusgeschlosseneEndungen", []),
-            self.logger
+            logger
         )
         
         excluded_folders = self.validator.validate_folders(
             data.get("AusgeschlosseneOrdner", []),
-            self.logger
+            logger
+        )
+        
+        preserve_metadata = self.validator.validate_preserve_metadata(
+            data.get("MetadatenErhalten", False),
+            logger
+        )
+        
+        parallel_copies = self.validator.validate_parallel_copies(
+            data.get("ParalleleKopien", 0),
+            logger
         )
         
         return SorterConfig(
             categories=categories,
             default_category=default_category,
             excluded_extensions=excluded_extensions,
-            excluded_folders=excluded_folders
+            excluded_folders=excluded_folders,
+            preserve_metadata=preserve_metadata,
+            parallel_copies=parallel_copies
         )
\ No newline at end of file
@@ -6,71 +6,77 @@ File information dialog component.
 import os
 import datetime
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from typing import Callable, Dict
+from tkinter import filedialog, messagebox, ttk, font
+from typing import Callable, Dict, Optional, Union
 from ui_components import DialogPositioner
 
 
-def format_size(size_bytes: int, translator: Callable) -> str:
-    """Format file size in human-readable format."""
-    _ = translator
-    
+# Units above bytes, one per power of 1024
+_SIZE_UNITS = ("KB", "MB", "GB", "TB")
+
+
+def format_size(size_bytes: int, translator: Callable, bytes_suffix: Optional[str] = None) -> str:
+    """Format file size in human-readable format (bytes_suffix: already translated label)."""
     if size_bytes < 0:
         return "N/A"
     
     if size_bytes < 1024:
-        return f"{size_bytes} {_('BytesSuffix', default='Bytes')}"
-    elif size_bytes < 1024**2:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024**3:
-        return f"{size_bytes / (1024**2):.2f} MB"
-    else:
-        return f"{size_bytes / (1024**3):.2f} GB"
+        if bytes_suffix is None:
+            bytes_suffix = translator('BytesSuffix', default='Bytes')
+        return f"{size_bytes} {bytes_suffix}"
+    
+    # bit_length picks the power of 1024 directly (10 bits per unit)
+    exponent = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS))
+    return f"{size_bytes / (1 << (10 * exponent)):.2f} {_SIZE_UNITS[exponent - 1]}"
 
 
-def gather_file_info(file_path: str, translator: Callable) -> Dict[str, str]:
-    """Gather information about a file."""
+def gather_file_info(file_path: Union[str, os.DirEntry], translator: Callable) -> Dict[str, str]:
+    """Gather information about a file (a path, or a DirEntry whose cached stat is reused)."""
     _ = translator
-    stats = os.stat(file_path)
+    if isinstance(file_path, os.DirEntry):
+        stats = file_path.stat()
+        file_path = file_path.path
+    else:
+        stats = os.stat(file_path)
+    full_path = os.path.abspath(file_path)
+    directory, filename = os.path.split(full_path)
     info = {}
     
     # Basic info
-    info[_("FileInfoLabelFilename", default="Dateiname")] = os.path.basename(file_path)
-    info[_("FileInfoLabelFullPath", default="Voller Pfad")] = os.path.abspath(file_path)
-    info[_("FileInfoLabelDirectory", default="Verzeichnis")] = os.path.dirname(os.path.abspath(file_path))
+    info[_("FileInfoLabelFilename", default="Dateiname")] = filename
+    info[_("FileInfoLabelFullPath", default="Voller Pfad")] = full_path
+    info[_("FileInfoLabelDirectory", default="Verzeichnis")] = directory
     
     # Size
-    size_str = f"{format_size(stats.st_size, _)} ({stats.st_size:,} {_('BytesSuffix', default='Bytes')})"
+    bytes_suffix = _('BytesSuffix', default='Bytes')
+    size_str = f"{format_size(stats.st_size, _, bytes_suffix)} ({stats.st_size:,} {bytes_suffix})"
     info[_("FileInfoLabelSize", default="Größe")] = size_str.replace(",", ".")
     
     # Timestamps
     dt_format = _("DateTimeFormat", default="%d.%m.%Y %H:%M:%S")
     created_suffix = _("FileInfoCreatedSuffix", default=" (Metadaten)")
+    fromtimestamp = datetime.datetime.fromtimestamp
+    key_created = _("FileInfoLabelCreated", default="Erstellt")
+    key_modified = _("FileInfoLabelModified", default="Geändert")
+    key_accessed = _("FileInfoLabelAccessed", default="Zugriff")
     
     try:
-        info[_("FileInfoLabelCreated", default="Erstellt")] = (
-            datetime.datetime.fromtimestamp(stats.st_ctime).strftime(dt_format) + 
-            created_suffix
-        )
+        info[key_created] = fromtimestamp(stats.st_ctime).strftime(dt_format) + created_suffix
     except OSError:
-        info[_("FileInfoLabelCreated", default="Erstellt")] = "N/A"
+        info[key_created] = "N/A"
     
     try:
-        info[_("FileInfoLabelModified", default="Geändert")] = (
-            datetime.datetime.fromtimestamp(stats.st_mtime).strftime(dt_format)
-        )
+        info[key_modified] = fromtimestamp(stats.st_mtime).strftime(dt_format)
     except OSError:
-        info[_("FileInfoLabelModified", default="Geändert")] = "N/A"
+        info[key_modified] = "N/A"
     
     try:
-        info[_("FileInfoLabelAccessed", default="Zugriff")] = (
-            datetime.datetime.fromtimestamp(stats.st_atime).strftime(dt_format)
-        )
+        info[key_accessed] = fromtimestamp(stats.st_atime).strftime(dt_format)
     except OSError:
-        info[_("FileInfoLabelAccessed", default="Zugriff")] = "N/A"
+        info[key_accessed] = "N/A"
     
     # Extension
-    basename_part, extension = os.path.splitext(os.path.basename(file_path))
+    extension = os.path.splitext(filename)[1]
     no_ext_str = _("FileInfoNoExtension", default="(Keine)")
     info[_("FileInfoLabelExtension", default="Dateiendung")] = extension if extension else no_ext_str
     
@@ -95,7 +101,7 @@ def show_file_info_dialog(parent: tk.Widget, translator: Callable) -> None:
         info_dict = gather_file_info(file_path, _)
         
         # Show dialog
-        FileInfoDialog(parent, info_dict, _)
+        FileInfoDialog(parent, info_dict, _, file_title=os.path.basename(file_path))
         
     except FileNotFoundError:
         messagebox.showerror(
@@ -120,15 +126,19 @@ def show_file_info_dialog(parent: tk.Widget, translator: Callable) -> None:
 class FileInfoDialog(tk.Toplevel):
     """Dialog showing file information."""
     
-    def __init__(self, parent: tk.Widget, info_dict: Dict[str, str], translator_func: Callable):
+    def __init__(self, parent: tk.Widget, info_dict: Dict[str, str], translator_func: Callable,
+                 file_title: Optional[str] = None):
         super().__init__(parent)
         self.transient(parent)
         self.parent = parent
         self._ = translator_func
         
-        # Get filename for title
-        filename_key = translator_func("FileInfoLabelFilename", default="Dateiname")
-        file_title = info_dict.get(filename_key, translator_func("DefaultFileTitle", default="Datei"))
+        # Get filename for title (looked up in info_dict only if not passed in)
+        if file_title is None:
+            filename_key = translator_func("FileInfoLabelFilename", default="Dateiname")
+            file_title = info_dict.get(filename_key)
+            if file_title is None:
+                file_title = translator_func("DefaultFileTitle", default="Datei")
         
         self.title(self._("FileInfoDialogTitle", default="Infos für: {filename}", filename=file_title))
         self.resizable(False, False)
@@ -149,22 +159,35 @@ class FileInfoDialog(tk.Toplevel):
         main_frame = ttk.Frame(self, padding="15")
         main_frame.pack(expand=True, fill=tk.BOTH)
         
-        # Info frame
-        info_frame = ttk.Frame(main_frame)
-        info_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        info_frame.columnconfigure(1, weight=1)
+        # All rows go into one read-only Text widget ("key:<Tab>value"),
+        # which stays selectable for copying
+        base_font = font.nametofont("TkDefaultFont")
+        key_font = base_font.copy()
+        key_font.configure(weight="bold")
+        labels = [f"{key}:" for key in info_dict]
+        tab_stop = max((key_font.measure(label) for label in labels), default=0) + 10
+        
+        info_text = tk.Text(
+            main_frame,
+            wrap="none",
+            width=90,
+            height=min(len(labels), 20) or 1,
+            font=base_font,
+            tabs=(tab_stop,),
+            relief=tk.FLAT,
+            background=self.cget("background")
+        )
+        info_text.tag_configure("key", font=key_font)
         
-        # Display each piece of information
-        for row, (key, value) in enumerate(info_dict.items()):
-            # Label
-            lbl = ttk.Label(info_frame, text=f"{key}:")
-            lbl.grid(row=row, column=0, sticky="nw", padx=(0, 10), pady=2)
-            
-            # Value (in read-only entry for easy copying)
-            entry = ttk.Entry(info_frame, width=70)
-            entry.insert(0, value)
-            entry.config(state="readonly")
-            entry.grid(row=row, column=1, sticky="ew", pady=2)
+        content = []
+        for label, value in zip(labels, info_dict.values()):
+            content.extend((label, "key", f"\t{value}\n", ""))
+        if content:
+            info_text.insert("1.0", *content)
+            info_text.delete("end-2c")  # Trailing newline
+        info_text.config(state="disabled")
+        info_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.key_font = key_font  # Keep the named font alive
         
         # OK button
         ok_frame = ttk.Frame(main_frame)
@@ -4,9 +4,16 @@ File sorting logic extracted from main application.
 Handles file categorization, copying, and moving operations.
 """
 
+import errno
 import os
 import shutil
-from typing import List, Tuple, Callable, Optional
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain
+from typing import Iterable, Iterator, List, Tuple, Callable, Optional
 from dataclasses import dataclass
 from config_models import SorterConfig
 
@@ -29,71 +36,271 @@ class FileOperation:
     operation_type: str  # 'copy' or 'move'
 
 
+# Bytes requested per in-kernel copy call
+_KERNEL_COPY_CHUNK = 2 ** 30
+# Buffer size for the portable user-space copy (larger buffers don't help on Windows)
+_COPY_BUFSIZE = 256 * 1024 if sys.platform == 'win32' else 1024 * 1024
+# copy_file_range errors that mean "not supported here", not "copy failed"
+_COPY_FILE_RANGE_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.EPERM
+}
+# sendfile to a regular file works on Linux 2.6.33+ only
+_SENDFILE_AVAILABLE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+_SENDFILE_UNSUPPORTED = {errno.ENOSYS, errno.EINVAL, errno.ENOTSOCK, errno.EOPNOTSUPP}
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """
+    Copy file data in the kernel via copy_file_range (Linux).
+    Uses reflinks on CoW filesystems (btrfs, XFS).
+    Returns False if the syscall is not supported for these files.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        copied = 0
+        while True:
+            try:
+                sent = os.copy_file_range(in_fd, out_fd, _KERNEL_COPY_CHUNK)
+            except OSError as e:
+                if copied == 0 and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                    return False
+                raise
+            if sent == 0:
+                # 0 on the first call for a non-empty file means "not supported"
+                # (procfs/sysfs, some FUSE and network filesystems), not EOF
+                return copied > 0 or os.fstat(in_fd).st_size == 0
+            copied += sent
+
+
+def _sendfile(src: str, dst: str) -> bool:
+    """
+    Copy file data in the kernel via sendfile (Linux), e.g. where
+    copy_file_range is missing or refuses cross-filesystem copies.
+    Returns False if the syscall is not supported for these files.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        offset = 0
+        while True:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, _KERNEL_COPY_CHUNK)
+            except OSError as e:
+                if offset == 0 and e.errno in _SENDFILE_UNSUPPORTED:
+                    return False
+                raise
+            if sent == 0:
+                # As in _copy_file_range: an immediate 0 for a non-empty file is not EOF
+                return offset > 0 or os.fstat(in_fd).st_size == 0
+            offset += sent
+
+
+def _copy_file_win32(src: str, dst: str) -> bool:
+    """
+    Copy file data with the native CopyFileW (Windows).
+    Returns False if ctypes is not available.
+    """
+    try:
+        import ctypes
+        copy_file = ctypes.windll.kernel32.CopyFileW
+    except (ImportError, AttributeError):
+        return False
+    
+    if not copy_file(ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), False):
+        raise ctypes.WinError()
+    return True
+
+
+def _copy_buffered(src: str, dst: str) -> None:
+    """Portable user-space copy with a large buffer."""
+    # Unbuffered file objects: copyfileobj's buffer is the only copy in user space
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFSIZE)
+
+
+def fast_copy(src: str, dst: str, preserve_metadata: bool = True) -> str:
+    """
+    Copy a file with metadata using the fastest available path.
+    Drop-in replacement for shutil.copy2 (also usable as copy_function for shutil.move).
+    With preserve_metadata=False only the access/modification times are
+    copied (no permission bits, flags or extended attributes).
+    """
+    if hasattr(os, 'copy_file_range') and _copy_file_range(src, dst):
+        pass
+    elif _SENDFILE_AVAILABLE and _sendfile(src, dst):
+        pass
+    elif sys.platform == 'win32' and _copy_file_win32(src, dst):
+        pass
+    elif sys.platform == 'darwin':
+        # shutil.copyfile uses fcopyfile on macOS
+        shutil.copyfile(src, dst)
+    else:
+        _copy_buffered(src, dst)
+    
+    if preserve_metadata:
+        shutil.copystat(src, dst)
+    else:
+        st = os.stat(src)
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+
 class FileSorter:
     """Handles file sorting operations."""
     
-    def __init__(self, config: SorterConfig, logger: Optional[Callable] = None):
+    # Log templates used on the per-file path
+    RENAME_LOG = "Datei existiert bereits, benenne um: {filename} -> {folder}"
+    OPERATION_ERROR_LOG = "FEHLER bei {operation}: {filename} -> {folder}: {error}"
+    UNEXPECTED_ERROR_LOG = "Unerwarteter Fehler: {filename}: {error}"
+    
+    # Concurrent copy/move operations (I/O-bound, the GIL is released)
+    DEFAULT_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+    
+    # Progress/total callbacks while walking: at most every PROGRESS_INTERVAL
+    # seconds or every 1/PROGRESS_STEPS of the files found so far
+    PROGRESS_INTERVAL = 0.05
+    PROGRESS_STEPS = 200
+    
+    def __init__(self, config: SorterConfig, logger: Optional[Callable] = None,
+                 max_workers: Optional[int] = None):
         self.config = config
         self.logger = logger or print
-        self.extension_map = config.build_extension_map()
+        self.max_workers = max_workers or config.parallel_copies or self.DEFAULT_MAX_WORKERS
+        self._log_lock = threading.Lock()
+        self.extension_map = config.build_extension_map(self.logger)
+        self._excluded_folders = frozenset(f.lower() for f in config.excluded_folders)
+        self._excluded_extensions = frozenset(config.excluded_extensions)
+        # Final (category, relative_path) per extension, built once per config
+        self._relpath_map = {
+            ext: self._relative_path(category, ext) for ext, category in self.extension_map.items()
+        }
+        self._default_target = (config.default_category, config.default_category)
+        self._preserve_metadata = config.preserve_metadata
+        # Dots in the longest configured suffix (".tar.gz" -> 2)
+        self._max_suffix_parts = max(
+            (ext.count('.') for ext in chain(self.extension_map, config.excluded_extensions)),
+            default=1
+        )
+        self._created_dirs = set()
+        self._next_counter = {}
+        self._dir_listing = {}
+        self._same_device = False
+    
+    def _log(self, message: str) -> None:
+        """Log from worker threads without interleaving calls."""
+        with self._log_lock:
+            self.logger(message)
     
     def discover_files(self, source_dir: str, target_dir: str) -> List[str]:
         """Discover all files to be sorted."""
-        all_files = []
-        target_abs = os.path.abspath(target_dir)
-        
         self.logger("Suche Dateien...")
+        all_files = [entry.path for entry in self.iter_files(source_dir, target_dir)]
+        self.logger(f"{len(all_files)} Dateien gefunden.")
+        return all_files
+    
+    def iter_files(self, source_dir: str, target_dir: str) -> Iterator[os.DirEntry]:
+        """
+        Yield file entries below source_dir (same order as os.walk, topdown).
+        DirEntry caches the file type, so no extra stat per entry is needed.
+        """
+        # Normalize once; paths below an absolute root stay absolute
+        target_abs = os.path.abspath(target_dir)
+        target_prefix = os.path.join(target_abs, '')
+        excluded = self._excluded_folders
+        pending = [os.path.abspath(source_dir)]
         
-        for root, dirs, files in os.walk(source_dir, topdown=True):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d.lower() not in self.config.excluded_folders]
+        while pending:
+            current = pending.pop()
             
             # Skip if we're inside the target directory
-            root_abs = os.path.abspath(root)
-            if root_abs.startswith(target_abs):
+            if current == target_abs or current.startswith(target_prefix):
                 continue
             
-            # Add all files from this directory
-            for filename in files:
-                all_files.append(os.path.join(root, filename))
+            subdirs = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        
+                        if not is_dir:
+                            yield entry
+                        elif entry.name.lower() not in excluded and not entry.is_symlink():
+                            subdirs.append(entry.path)
+            except OSError:
+                continue
+            
+            pending.extend(reversed(subdirs))
+    
+    def _suffixes(self, filename: str) -> List[str]:
+        """
+        Lowercased candidate extensions of a filename, longest first
+        ("a.tar.gz" -> [".tar.gz", ".gz"]), limited to the longest configured suffix.
+        Leading dots are not extensions, as in os.path.splitext.
+        """
+        # Dots are found in the original name; only the short suffix
+        # slices are lowercased, not the whole file name
+        stem_start = len(filename) - len(filename.lstrip('.'))
         
-        self.logger(f"{len(all_files)} Dateien gefunden.")
-        return all_files
+        suffixes = []
+        end = len(filename)
+        for _ in range(self._max_suffix_parts):
+            end = filename.rfind('.', stem_start + 1, end)
+            if end == -1:
+                break
+            suffixes.append(filename[end:].lower())
+        
+        suffixes.reverse()
+        return suffixes
     
     def categorize_file(self, file_path: str) -> Tuple[str, str]:
         """
         Categorize a file based on its extension.
         Returns: (category_name, relative_target_path)
         """
-        filename = os.path.basename(file_path)
-        _, extension = os.path.splitext(filename)
-        extension_lower = extension.lower() if extension else ''
+        return self._categorize_name(os.path.basename(file_path))
+    
+    def _categorize_name(self, filename: str) -> Tuple[str, str]:
+        """categorize_file() for a bare file name (e.g. DirEntry.name)."""
+        suffixes = self._suffixes(filename)
         
         # Check if extension is excluded
-        if extension_lower in self.config.excluded_extensions:
-            return None, None
+        excluded = self._excluded_extensions
+        for suffix in suffixes:
+            if suffix in excluded:
+                return None, None
         
-        # Get category for this extension
-        category_name = self.extension_map.get(
-            extension_lower, 
-            self.config.default_category
-        )
+        # Target for the longest configured suffix
+        relpath_map = self._relpath_map
+        for suffix in suffixes:
+            target = relpath_map.get(suffix)
+            if target is not None:
+                return target
         
-        # Build target path
-        if category_name != self.config.default_category and extension_lower:
+        return self._default_target
+    
+    def _relative_path(self, category_name: str, extension_lower: str) -> Tuple[str, str]:
+        """(category_name, relative_target_path) for a configured extension."""
+        if category_name != self.config.default_category:
             # Create subfolder for specific file type
             type_folder = extension_lower.lstrip('.')
             if type_folder:
-                relative_path = os.path.join(category_name, type_folder)
-            else:
-                relative_path = category_name
-        else:
-            relative_path = category_name
-        
-        return category_name, relative_path
+                return category_name, os.path.join(category_name, type_folder)
+        return category_name, category_name
+    
+    def _ensure_dir(self, directory: str) -> None:
+        """Create a directory once per sort run."""
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
     
     def get_unique_target_path(self, target_dir: str, filename: str) -> str:
-        """Get a unique target path, handling duplicates."""
+        """
+        Get a unique target path, handling duplicates.
+        Only computes the name; nothing is created (sort_files() reserves
+        its targets with _reserve_target() instead).
+        """
         target_path = os.path.join(target_dir, filename)
         
         if not os.path.exists(target_path):
@@ -109,6 +316,66 @@ class FileSorter:
         
         return target_path
     
+    def _reserve_target(self, target_dir: str, filename: str,
+                        prefix: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Pick a unique target name for sort_files() and reserve it atomically
+        (O_CREAT | O_EXCL) as an empty placeholder, so no other writer can
+        claim the same name. Returns (target_path, chosen_file_name).
+        prefix is target_dir with a trailing separator, if the caller has it cached.
+        
+        The placeholder is replaced by the copy/move, or removed again by
+        _discard_target() if the operation fails. If the process dies or is
+        killed mid-run, the placeholders of operations still queued at that
+        point (up to max_workers * 4) stay behind as empty files.
+        """
+        self._ensure_dir(target_dir)
+        if prefix is None:
+            prefix = os.path.join(target_dir, '')
+        
+        # Continue where the last collision for this name left off
+        key = (target_dir, filename)
+        counter = self._next_counter.get(key, 0)
+        name = ext = None
+        existing = None
+        
+        while True:
+            if counter == 0:
+                candidate = filename
+            else:
+                if name is None:
+                    name, ext = os.path.splitext(filename)
+                candidate = f"{name}({counter}){ext}"
+                if existing is not None and candidate in existing:
+                    counter += 1
+                    continue
+            target_path = prefix + candidate
+            try:
+                fd = os.open(target_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            except FileExistsError:
+                # On the first collision, read the directory once and skip
+                # names known to be taken; O_EXCL still has the final say
+                if existing is None:
+                    existing = self._listing(target_dir)
+                counter += 1
+                continue
+            
+            os.close(fd)
+            self._next_counter[key] = counter + 1
+            return target_path, candidate
+    
+    def _listing(self, directory: str) -> set:
+        """Names in a target directory, read once per sort run."""
+        names = self._dir_listing.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            self._dir_listing[directory] = names
+        return names
+    
     def process_file(self, file_op: FileOperation) -> bool:
         """
         Process a single file operation.
@@ -116,90 +383,217 @@ class FileSorter:
         """
         try:
             # Create target directory if needed
-            target_dir = os.path.dirname(file_op.target_path)
-            if not os.path.isdir(target_dir):
-                os.makedirs(target_dir, exist_ok=True)
+            self._ensure_dir(os.path.dirname(file_op.target_path))
             
             # Perform the operation
             if file_op.operation_type == "copy":
-                shutil.copy2(file_op.source_path, file_op.target_path)
+                fast_copy(file_op.source_path, file_op.target_path, self._preserve_metadata)
             elif file_op.operation_type == "move":
-                shutil.move(file_op.source_path, file_op.target_path)
+                self._move(file_op.source_path, file_op.target_path)
             else:
                 raise ValueError(f"Unknown operation type: {file_op.operation_type}")
             
             return True
             
         except OSError as e:
-            self.logger(f"FEHLER bei {file_op.operation_type}: {os.path.basename(file_op.source_path)} -> {file_op.category}: {e}")
+            self._discard_target(file_op)
+            self._log(self.OPERATION_ERROR_LOG.format(
+                operation=file_op.operation_type,
+                filename=os.path.basename(file_op.source_path),
+                folder=file_op.category,
+                error=e
+            ))
             return False
         except Exception as e:
-            self.logger(f"Unerwarteter Fehler: {os.path.basename(file_op.source_path)}: {e}")
+            self._discard_target(file_op)
+            self._log(self.UNEXPECTED_ERROR_LOG.format(
+                filename=os.path.basename(file_op.source_path),
+                error=e
+            ))
             return False
     
+    def _move(self, source_path: str, target_path: str) -> None:
+        """Move a file; a rename when source and target share a filesystem."""
+        if self._same_device:
+            try:
+                # Replaces the empty placeholder reserved for this file
+                os.replace(source_path, target_path)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+        
+        # Different filesystem: copy via fast_copy, then unlink.
+        # The placeholder goes first; shutil.move recreates symlinks
+        # with os.symlink, which fails on an existing target
+        try:
+            os.unlink(target_path)
+        except FileNotFoundError:
+            pass
+        shutil.move(source_path, target_path, copy_function=fast_copy)
+    
+    def _discard_target(self, file_op: FileOperation) -> None:
+        """Remove the reserved/partial target of a failed or dropped operation."""
+        try:
+            # While the source is intact, the target is our own leftover;
+            # without it, only an untouched (empty) placeholder is removed
+            if not os.path.lexists(file_op.source_path):
+                st = os.lstat(file_op.target_path)
+                if not stat.S_ISREG(st.st_mode) or st.st_size:
+                    return
+            os.unlink(file_op.target_path)
+        except OSError:
+            pass
+    
     def sort_files(self, source_dir: str, target_dir: str, operation: str,
-                   progress_callback: Optional[Callable[[int], None]] = None) -> SortResult:
+                   progress_callback: Optional[Callable[[int], None]] = None,
+                   total_callback: Optional[Callable[[int], None]] = None) -> SortResult:
         """
         Sort files from source to target directory.
+        Files are processed while the source tree is still being walked,
+        so the total is only final once the walk has finished.
         
         Args:
             source_dir: Source directory path
             target_dir: Target directory path
             operation: 'copy' or 'move'
             progress_callback: Optional callback for progress updates
+            total_callback: Optional callback with the number of files found so far
             
         Returns:
             SortResult with statistics
         """
         result = SortResult()
+        source_dir = os.path.abspath(source_dir)
+        target_dir = os.path.abspath(target_dir)
+        self._created_dirs.clear()
+        self._next_counter.clear()
+        self._dir_listing.clear()
         
-        # Discover files
-        all_files = self.discover_files(source_dir, target_dir)
-        result.total = len(all_files)
+        # Moves within one filesystem can be plain renames
+        try:
+            self._same_device = os.stat(source_dir).st_dev == os.stat(target_dir).st_dev
+        except OSError:
+            self._same_device = False
         
-        if result.total == 0:
-            self.logger("Keine Dateien zum Sortieren gefunden.")
-            return result
+        # Hoist lookups out of the per-file loop
+        log = self._log
+        rename_log = self.RENAME_LOG
+        operation_error_log = self.OPERATION_ERROR_LOG
+        categorize_name = self._categorize_name
+        reserve_target = self._reserve_target
+        process_file = self.process_file
+        join = os.path.join
+        category_dirs = {}
         
-        # Process each file
-        for i, source_path in enumerate(all_files):
-            filename = os.path.basename(source_path)
-            
-            # Categorize file
-            category, relative_path = self.categorize_file(source_path)
-            
-            if category is None:
-                # File was excluded
-                result.skipped += 1
-            else:
-                # Build target path
-                category_dir = os.path.join(target_dir, relative_path)
-                target_path = self.get_unique_target_path(category_dir, filename)
-                
-                # Check if we need to rename
-                if os.path.basename(target_path) != filename:
-                    self.logger(f"Datei existiert bereits, benenne um: {os.path.basename(target_path)} -> {relative_path}")
+        # Naming and directory creation stay on this thread (no races);
+        # the copy/move itself runs in the pool
+        max_pending = self.max_workers * 4
+        pending = set()
+        completed = 0
+        
+        # Throttle the callbacks; each one is a cross-thread update of the GUI
+        monotonic = time.monotonic
+        interval = self.PROGRESS_INTERVAL
+        steps = self.PROGRESS_STEPS
+        last_report = monotonic()
+        reported = 0
+        
+        self.logger("Suche Dateien...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Stream entries from the walk instead of collecting them first
+            for entry in self.iter_files(source_dir, target_dir):
+                source_path = entry.path
+                filename = entry.name
+                result.total += 1
                 
-                # Create file operation
-                file_op = FileOperation(
-                    source_path=source_path,
-                    target_path=target_path,
-                    category=relative_path,
-                    operation_type=operation
-                )
+                # Categorize file (by name; no path splitting needed)
+                category, relative_path = categorize_name(filename)
                 
-                # Process the file
-                if self.process_file(file_op):
-                    result.processed += 1
+                if category is None:
+                    # File was excluded
+                    result.skipped += 1
+                    completed += 1
                 else:
-                    result.errors += 1
+                    # Build target path (joined once per category folder)
+                    dirs = category_dirs.get(relative_path)
+                    if dirs is None:
+                        category_dir = join(target_dir, relative_path)
+                        dirs = category_dirs[relative_path] = (category_dir, join(category_dir, ''))
+                    try:
+                        target_path, new_name = reserve_target(dirs[0], filename, dirs[1])
+                    except OSError as e:
+                        log(operation_error_log.format(
+                            operation=operation, filename=filename, folder=relative_path, error=e
+                        ))
+                        result.errors += 1
+                        completed += 1
+                    else:
+                        # Check if we need to rename
+                        if new_name != filename:
+                            log(rename_log.format(filename=new_name, folder=relative_path))
+                        
+                        # Queue the file operation
+                        file_op = FileOperation(
+                            source_path=source_path,
+                            target_path=target_path,
+                            category=relative_path,
+                            operation_type=operation
+                        )
+                        try:
+                            pending.add(executor.submit(process_file, file_op))
+                        except BaseException:
+                            # Not queued (e.g. interpreter shutdown): drop the placeholder
+                            self._discard_target(file_op)
+                            raise
+                
+                # Bound the number of queued operations
+                if len(pending) >= max_pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    completed += self._tally(finished, result)
+                
+                # Report progress (throttled)
+                if (result.total - reported >= max(1, result.total // steps)
+                        or monotonic() - last_report >= interval):
+                    reported = result.total
+                    last_report = monotonic()
+                    if total_callback:
+                        total_callback(result.total)
+                    if progress_callback:
+                        progress_callback(completed)
             
-            # Report progress
+            # Final numbers of the walk
+            if total_callback:
+                total_callback(result.total)
             if progress_callback:
-                progress_callback(i + 1)
+                progress_callback(completed)
+            
+            if result.total == 0:
+                self.logger("Keine Dateien zum Sortieren gefunden.")
+                return result
+            self.logger(f"{result.total} Dateien gefunden.")
+            
+            # Wait for the remaining operations
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                completed += self._tally(finished, result)
+                if progress_callback:
+                    progress_callback(completed)
         
         return result
     
+    @staticmethod
+    def _tally(finished: Iterable, result: SortResult) -> int:
+        """Add finished process_file futures to the result; returns their count."""
+        count = 0
+        for future in finished:
+            if future.result():
+                result.processed += 1
+            else:
+                result.errors += 1
+            count += 1
+        return count
+    
     def validate_directories(self, source_dir: str, target_dir: str) -> Optional[str]:
         """
         Validate source and target directories.
@@ -19,6 +19,9 @@ except ImportError:
 class InfoWindow(tk.Toplevel):
     """Application information window with logo."""
     
+    # Resized logo, decoded once and reused by later windows
+    _logo_cache = None
+    
     def __init__(self, parent: tk.Widget, current_year: int, app_version: str, translator_func: Callable):
         super().__init__(parent)
         self.transient(parent)
@@ -83,37 +86,41 @@ class InfoWindow(tk.Toplevel):
             error_label.pack(pady=10)
             return
         
-        # Find logo path
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-        except NameError:
-            script_dir = os.getcwd()
-        
-        logo_path = os.path.join(script_dir, 'img', 'logo.jpg')
-        
-        try:
-            # Load and resize logo
-            img = Image.open(logo_path)
-            max_size = (200, 200)
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        if InfoWindow._logo_cache is None:
+            # Find logo path
+            try:
+                script_dir = os.path.dirname(os.path.abspath(__file__))
+            except NameError:
+                script_dir = os.getcwd()
             
-            # Convert to PhotoImage
-            self.logo_image = ImageTk.PhotoImage(img)
+            logo_path = os.path.join(script_dir, 'img', 'logo.jpg')
             
-            # Display
-            logo_label = ttk.Label(parent, image=self.logo_image)
-            logo_label.pack(pady=(0, 15))
-            
-        except FileNotFoundError:
-            error_label = ttk.Label(
-                parent,
-                text=self._("LogoNotFoundError", default="Logo nicht gefunden:\n{path}", path=logo_path)
-            )
-            error_label.pack(pady=10)
-        except Exception as e:
-            error_label = ttk.Label(
-                parent,
-                text=self._("LogoLoadError", default="Fehler Laden Logo:\n{error}", error=e),
-                justify=tk.LEFT
-            )
-            error_label.pack(pady=10)
\ No newline at end of file
+            try:
+                # Load and resize logo
+                img = Image.open(logo_path)
+                max_size = (200, 200)
+                img.thumbnail(max_size, Image.Resampling.LANCZOS)
+                
+                # Convert to PhotoImage
+                InfoWindow._logo_cache = ImageTk.PhotoImage(img)
+                
+            except FileNotFoundError:
+                error_label = ttk.Label(
+                    parent,
+                    text=self._("LogoNotFoundError", default="Logo nicht gefunden:\n{path}", path=logo_path)
+                )
+                error_label.pack(pady=10)
+                return
+            except Exception as e:
+                error_label = ttk.Label(
+                    parent,
+                    text=self._("LogoLoadError", default="Fehler Laden Logo:\n{error}", error=e),
+                    justify=tk.LEFT
+                )
+                error_label.pack(pady=10)
+                return
+        
+        # Display (keep a reference so Tk does not drop the image)
+        self.logo_image = InfoWindow._logo_cache
+        logo_label = ttk.Label(parent, image=self.logo_image)
+        logo_label.pack(pady=(0, 15))
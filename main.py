@@ -10,21 +10,18 @@ import os
 import threading
 import datetime
 import locale
+import importlib.util
 
 # Import new components
 from config_models import ConfigManager, SorterConfig
 from file_sorter import FileSorter, SortResult
 from ui_components import (
     StatusLogger, MenuBuilder, ProgressTracker,
-    DialogPositioner, safe_gui_operation
+    DialogPositioner, safe_gui_operation, ensure_styles
 )
 
-# Pillow import
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Pillow is only imported by the info window; just check that it is installed
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 # Translator import
 try:
@@ -84,7 +81,8 @@ class FileSorterApp:
                     default_lang='en'
                 )
                 self._ = self.translator.get_string
-                print(f"Translator initialisiert mit Sprache: {self.translator.language}")
+                # Report the requested code; reading .language would load it right away
+                print(f"Translator initialisiert mit Sprache: {initial_lang}")
             except Exception as e:
                 print(f"FEHLER bei Translator-Initialisierung: {e}")
                 messagebox.showerror(
@@ -198,9 +196,7 @@ class FileSorterApp:
             command=self.start_sorting_thread,
             style="Accent.TButton"
         )
-        
-        style = ttk.Style()
-        style.configure("Accent.TButton", foreground="white", background="#0078D7")
+        ensure_styles()
         
         self.start_button.grid(row=3, column=0, columnspan=3, pady=15)
     
@@ -257,7 +253,7 @@ class FileSorterApp:
             target=self.config.default_category
         ))
         
-        extension_count = len(self.config.build_extension_map())
+        extension_count = len(self.file_sorter.extension_map)
         self.log(self._(
             "MappingInfoLog",
             default="{ext_count} Endungen gemappt.",
@@ -346,7 +342,7 @@ class FileSorterApp:
         self.config = self.config_manager.load_config()
         self.file_sorter = FileSorter(self.config, self.log)
         
-        extension_count = len(self.config.build_extension_map())
+        extension_count = len(self.file_sorter.extension_map)
         self.log(self._(
             "ConfigReloadedLog",
             default="Konfig neu geladen.",
@@ -385,7 +381,7 @@ class FileSorterApp:
         
         # Start sorting
         self.start_button.config(state="disabled")
-        self.progress_tracker.reset()
+        self.progress_tracker.start()
         
         self.log(self._(
             "StartLog",
@@ -413,20 +409,13 @@ class FileSorterApp:
     def _sort_files_thread(self, source, target, operation):
         """Thread function for file sorting."""
         try:
-            # Set up progress callback
-            def progress_callback(current):
-                self.progress_tracker.update(current)
-            
-            # Perform sorting
+            # Progress is recorded here and polled by the GUI thread
             result = self.file_sorter.sort_files(
                 source, target, operation,
-                progress_callback=progress_callback
+                progress_callback=self.progress_tracker.update,
+                total_callback=self.progress_tracker.set_total
             )
             
-            # Update progress tracker maximum
-            if result.total > 0:
-                self.master.after(0, self.progress_tracker.set_maximum, result.total)
-            
             # Show completion
             self.master.after(0, self._show_completion_message, result)
             
@@ -436,6 +425,7 @@ class FileSorterApp:
                             self._("FatalErrorTitle"),
                             self._("FatalThreadErrorMsg", error=e))
         finally:
+            self.progress_tracker.finish()
             self.master.after(0, self._enable_start_button)
     
     def _show_completion_message(self, result: SortResult):
@@ -4,12 +4,33 @@ Enhanced Translator class with improved error handling and structure.
 """
 
 import json
+import logging
 import os
+import sys
 import locale
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+# Optional fast JSON parser; the stdlib json module is used otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Locale directories are resolved relative to this module (fixed at import)
+try:
+    _BASE_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+except NameError:
+    _BASE_DIR = Path.cwd()
+
+# Parsed locale files shared by all Translator instances:
+# path -> ((mtime_ns, size), translations)
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 @dataclass
 class TranslationConfig:
@@ -25,6 +46,13 @@ class TranslationError(Exception):
     pass
 
 
+class _SafeDict(dict):
+    """Format arguments that leave unknown placeholders in the text."""
+    
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
 class Translator:
     """Enhanced translator with better error handling and caching."""
     
@@ -48,19 +76,29 @@ class Translator:
         
         self.config = config
         self.translations: Dict[str, Any] = {}
-        self.language = self.config.default_lang
-        self._base_dir = self._get_base_directory()
-        self._translation_cache: Dict[str, str] = {}
+        self._language = self.config.default_lang
+        self._base_dir = _BASE_DIR
+        self._translation_cache: Dict[Tuple[str, Optional[str]], str] = {}
         
-        # Load initial language
-        self.load_language(self.config.language_code)
+        # The initial language is loaded on first use (see _ensure_loaded)
+        self._pending_language: Optional[str] = self.config.language_code
     
-    def _get_base_directory(self) -> Path:
-        """Get the base directory for locale files."""
-        try:
-            return Path(os.path.dirname(os.path.abspath(__file__)))
-        except NameError:
-            return Path.cwd()
+    @property
+    def language(self) -> str:
+        """Code of the loaded language (loads the initial language if needed)."""
+        if self._pending_language is not None:
+            self._ensure_loaded()
+        return self._language
+    
+    @language.setter
+    def language(self, lang_code: str) -> None:
+        self._language = lang_code
+    
+    def _ensure_loaded(self) -> None:
+        """Load the language requested at construction, once."""
+        lang_code = self._pending_language
+        if lang_code is not None:
+            self.load_language(lang_code)
     
     def _get_locale_path(self, lang_code: str) -> Path:
         """Get the full path to a locale file."""
@@ -69,6 +107,7 @@ class Translator:
     def _load_json_file(self, file_path: Path) -> Dict[str, Any]:
         """
         Load and parse a JSON file with proper error handling.
+        Files are parsed once and reused until their mtime or size changes.
         
         Args:
             file_path: Path to the JSON file
@@ -79,9 +118,31 @@ class Translator:
         Raises:
             TranslationError: If file cannot be loaded or parsed
         """
+        cache_key = str(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            st = os.stat(file_path)
+            version = (st.st_mtime_ns, st.st_size)
+            cached = _FILE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            
+            if ORJSON_AVAILABLE:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            if isinstance(data, dict):
+                # Intern keys and strings once; lookups by literal key then
+                # hit on identity and repeated labels share one object
+                intern = sys.intern
+                data = {
+                    intern(k): intern(v) if isinstance(v, str) else v
+                    for k, v in data.items()
+                }
+            _FILE_CACHE[cache_key] = (version, data)
+            return data
         except FileNotFoundError:
             raise TranslationError(f"Translation file not found: {file_path}")
         except json.JSONDecodeError as e:
@@ -99,47 +160,25 @@ class Translator:
         Returns:
             True if successfully loaded, False otherwise
         """
+        self._pending_language = None  # An explicit load replaces the deferred one
         self._translation_cache.clear()  # Clear cache when changing language
         
-        # Try to load requested language
-        try:
-            file_path = self._get_locale_path(lang_code)
-            self.translations = self._load_json_file(file_path)
-            self.language = lang_code
-            print(f"INFO: Language '{lang_code}' successfully loaded.")
-            return True
-            
-        except TranslationError as e:
-            print(f"WARNING: {e}")
-            
-            # Try fallback language if different
-            if lang_code != self.config.default_lang:
-                try:
-                    return self._load_fallback_language()
-                except TranslationError as fallback_error:
-                    print(f"ERROR: {fallback_error}")
+        # Requested language first, then the default language (once)
+        for code in dict.fromkeys((lang_code, self.config.default_lang)):
+            try:
+                self.translations = self._load_json_file(self._get_locale_path(code))
+            except TranslationError as e:
+                logger.warning("%s", e)
+                continue
             
-            # No translations available
-            self.translations = {}
-            print("WARNING: No translations loaded. Using keys as fallback.")
-            return False
-    
-    def _load_fallback_language(self) -> bool:
-        """
-        Load the fallback language.
+            self.language = code
+            logger.info("Language '%s' successfully loaded.", code)
+            return True
         
-        Returns:
-            True if successfully loaded
-            
-        Raises:
-            TranslationError: If fallback cannot be loaded
-        """
-        print(f"INFO: Attempting to load fallback language '{self.config.default_lang}'...")
-        fallback_path = self._get_locale_path(self.config.default_lang)
-        self.translations = self._load_json_file(fallback_path)
-        self.language = self.config.default_lang
-        print(f"INFO: Fallback language '{self.config.default_lang}' loaded.")
-        return True
+        # No translations available
+        self.translations = {}
+        logger.warning("No translations loaded. Using keys as fallback.")
+        return False
     
     def get_string(self, key: str, default: Optional[str] = None, **kwargs) -> str:
         """
@@ -153,34 +192,31 @@ class Translator:
         Returns:
             Translated and formatted string
         """
-        # Check cache first
-        cache_key = f"{key}:{repr(sorted(kwargs.items()))}" if kwargs else key
-        if cache_key in self._translation_cache:
-            return self._translation_cache[cache_key]
+        if self._pending_language is not None:
+            self._ensure_loaded()
         
-        # Get base translation
-        if self.config.fallback_to_key:
-            fallback_value = default if default is not None else key
-        else:
-            fallback_value = default or ""
+        # Templates are cached per (key, default), so a missing key does not
+        # pin the first caller's default; formatting is applied per call
+        cache_key = (key, default)
+        translated = self._translation_cache.get(cache_key)
+        if translated is None:
+            if self.config.fallback_to_key:
+                fallback_value = default if default is not None else key
+            else:
+                fallback_value = default or ""
+            
+            translated = self.translations.get(key, fallback_value)
+            self._translation_cache[cache_key] = translated
         
-        translated = self.translations.get(key, fallback_value)
+        if not kwargs:
+            return translated
         
-        # Apply formatting if needed
-        if kwargs:
-            try:
-                result = translated.format(**kwargs)
-                self._translation_cache[cache_key] = result
-                return result
-            except KeyError as e:
-                print(f"WARNING: Missing placeholder {e} for key '{key}' in '{self.language}'")
-                return translated
-            except Exception as e:
-                print(f"ERROR: Format error for key '{key}': {e}")
-                return translated
-        
-        self._translation_cache[cache_key] = translated
-        return translated
+        # Apply formatting; placeholders without an argument are kept as-is
+        try:
+            return translated.format_map(_SafeDict(kwargs))
+        except Exception as e:
+            logger.error("Format error for key '%s': %s", key, e)
+            return translated
     
     def get_available_languages(self) -> list[str]:
         """
@@ -224,7 +260,7 @@ class Translator:
             if system_locale:
                 return system_locale.split('_')[0].lower()
         except Exception as e:
-            print(f"WARNING: Could not detect system language: {e}")
+            logger.warning("Could not detect system language: %s", e)
         
         return 'en'  # Default fallback
     
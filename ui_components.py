@@ -5,68 +5,79 @@ Eliminates duplication and provides consistent UI behavior.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import List, Optional, Callable, Tuple
-import datetime
+from tkinter import ttk, messagebox, simpledialog
+from typing import Iterable, List, Optional, Callable, Tuple
+import bisect
+import os
+import queue
+import threading
+import time
 from contextlib import contextmanager
 
+# Strips path separators; lets a folder name be checked for them in one pass
+_SEP_TABLE = str.maketrans('', '', os.sep + (os.altsep or ''))
+
 
 class ListboxManager:
-    """Generic manager for listbox operations to eliminate duplication."""
+    """
+    Generic manager for listbox operations to eliminate duplication.
+    Keeps a sorted mirror of the listbox items, so adding or removing an
+    item touches a single row instead of rebuilding the list.
+    """
     
     def __init__(self, listbox: tk.Listbox):
         self.listbox = listbox
+        self._items: List[str] = []
     
-    def populate(self, items: List[str], selected_value: Optional[str] = None) -> None:
-        """Populate listbox with items, optionally selecting one."""
+    def populate(self, items: Iterable[str], selected_value: Optional[str] = None,
+                 keep_selection: bool = True) -> None:
+        """Populate listbox with items (any iterable, sorted once here), optionally selecting one."""
         # Save current selection if no specific value requested
-        if selected_value is None:
-            selection = self.listbox.curselection()
-            if selection:
-                selected_value = self.listbox.get(selection[0])
+        if selected_value is None and keep_selection:
+            selected_value = self.get_selected()
         
         # Clear and repopulate
         self.listbox.delete(0, tk.END)
         
         # Add sorted items
-        sorted_items = sorted(items)
-        new_selection_index = -1
+        self._items = sorted(items)
+        if self._items:
+            self.listbox.insert(tk.END, *self._items)
         
-        for i, item in enumerate(sorted_items):
-            self.listbox.insert(tk.END, item)
-            if item == selected_value:
-                new_selection_index = i
-        
-        # Restore selection
-        if new_selection_index != -1:
-            self._select_item(new_selection_index)
+        # Restore selection (the items are sorted, so bisect finds it)
+        if selected_value is not None:
+            index = bisect.bisect_left(self._items, selected_value)
+            if index < len(self._items) and self._items[index] == selected_value:
+                self._select_item(index)
     
     def get_selected(self) -> Optional[str]:
-        """Get currently selected item."""
+        """Get currently selected item (read from the mirror, not from Tk)."""
         selection = self.listbox.curselection()
-        if selection:
-            return self.listbox.get(selection[0])
+        if selection and selection[0] < len(self._items):
+            return self._items[selection[0]]
         return None
     
     def add_item(self, item: str, select: bool = True) -> bool:
-        """Add item to listbox if not already present."""
-        items = list(self.listbox.get(0, tk.END))
-        if item in items:
+        """Add item at its sorted position if not already present."""
+        index = bisect.bisect_left(self._items, item)
+        if index < len(self._items) and self._items[index] == item:
             return False
         
-        # Add and repopulate to maintain sort
-        items.append(item)
-        self.populate(items, item if select else None)
+        self._items.insert(index, item)
+        self.listbox.insert(index, item)
+        if select:
+            self._select_item(index)
         return True
     
     def remove_selected(self) -> Optional[str]:
         """Remove currently selected item."""
-        selected = self.get_selected()
-        if selected:
-            items = list(self.listbox.get(0, tk.END))
-            items.remove(selected)
-            self.populate(items)
-        return selected
+        selection = self.listbox.curselection()
+        if not selection:
+            return None
+        
+        index = selection[0]
+        self.listbox.delete(index)
+        return self._items.pop(index)
     
     def _select_item(self, index: int) -> None:
         """Select item at given index."""
@@ -80,23 +91,61 @@ class ListboxManager:
 
 
 class StatusLogger:
-    """Handles status text logging with timestamps."""
+    """
+    Handles status text logging with timestamps.
+    log() only queues the line (safe from worker threads); the GUI thread
+    inserts queued lines in batches.
+    """
+    
+    DRAIN_INTERVAL_MS = 200
+    MAX_BATCH = 200
     
     def __init__(self, text_widget: tk.Text):
         self.text_widget = text_widget
+        self._queue = queue.SimpleQueue()
+        self._stamp_second = None
+        self._stamp = ""
+        self.text_widget.after(self.DRAIN_INTERVAL_MS, self._drain)
     
     def log(self, message: str) -> None:
         """Log a message with timestamp."""
+        # Formatting happens in _drain() on the GUI thread
+        self._queue.put((time.time(), message))
+    
+    def _format(self, timestamp: float, message: str) -> str:
+        """One status line; the timestamp is formatted at most once per second."""
+        second = int(timestamp)
+        if second != self._stamp_second:
+            self._stamp = time.strftime("%H:%M:%S", time.localtime(second))
+            self._stamp_second = second
+        return f"[{self._stamp}] {message}\n"
+    
+    def _drain(self) -> None:
+        """Insert queued lines with a single widget update."""
+        lines = []
         try:
-            self.text_widget.config(state='normal')
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            self.text_widget.insert(tk.END, f"[{timestamp}] {message}\n")
-            self.text_widget.see(tk.END)
-            self.text_widget.config(state='disabled')
+            while len(lines) < self.MAX_BATCH:
+                lines.append(self._format(*self._queue.get_nowait()))
+        except queue.Empty:
+            pass
+        
+        if lines:
+            try:
+                self.text_widget.config(state='normal')
+                self.text_widget.insert(tk.END, "".join(lines))
+                self.text_widget.see(tk.END)
+                self.text_widget.config(state='disabled')
+            except tk.TclError:
+                return  # Widget is gone
+            except Exception as e:
+                print(f"Log-Fehler: {e}")
+        
+        # Come back right away while a backlog remains
+        delay = 1 if len(lines) == self.MAX_BATCH else self.DRAIN_INTERVAL_MS
+        try:
+            self.text_widget.after(delay, self._drain)
         except tk.TclError:
             pass
-        except Exception as e:
-            print(f"Log-Fehler: {e}")
 
 
 class MenuBuilder:
@@ -187,16 +236,19 @@ class ValidationHelper:
         if not ext:
             return False, "", _("EmptyInputExtensionMsg", default="Keine Endung eingegeben.")
         
-        # Ensure it starts with a dot
-        if not ext.startswith('.'):
+        # Ensure it starts with a dot; only a bare "." can then be too short
+        if ext[0] != '.':
             ext = '.' + ext
-        
-        # Check minimum length
-        if len(ext) < 2:
+        elif len(ext) < 2:
             return False, ext, _("InvalidExtensionWarningMsg", default=f"Ungültige Endung: {ext}")
         
         return True, ext, ""
     
+    @staticmethod
+    def has_path_separator(name: str) -> bool:
+        """True if a name contains a path separator (os.sep or os.altsep)."""
+        return name.translate(_SEP_TABLE) != name
+    
     @staticmethod
     def validate_folder_name(folder: str, translator: Callable) -> Tuple[bool, str, str]:
         """
@@ -210,13 +262,24 @@ class ValidationHelper:
             return False, "", _("EmptyInputFolderMsg", default="Kein Ordnername eingegeben.")
         
         # Check for path separators
-        import os
-        if os.sep in folder or (os.altsep and os.altsep in folder):
+        if ValidationHelper.has_path_separator(folder):
             return False, folder, _("InvalidFolderNameWarningMsg", default="Ordnername darf keine Pfadtrenner enthalten.")
         
         return True, folder.lower(), ""
 
 
+_STYLES_CONFIGURED = False
+
+
+def ensure_styles() -> None:
+    """Configure the shared ttk styles (only the first call does any work)."""
+    global _STYLES_CONFIGURED
+    if _STYLES_CONFIGURED:
+        return
+    ttk.Style().configure("Accent.TButton", foreground="white", background="#0078D7")
+    _STYLES_CONFIGURED = True
+
+
 @contextmanager
 def safe_gui_operation(parent: tk.Widget, operation_name: str, translator: Callable):
     """
@@ -254,8 +317,6 @@ class InputDialog:
     
     def show(self) -> Optional[str]:
         """Show dialog and return validated input."""
-        from tkinter import simpledialog
-        
         while True:
             value = simpledialog.askstring(self.title, self.prompt, parent=self.parent)
             
@@ -279,25 +340,63 @@ class InputDialog:
 class ProgressTracker:
     """Manages progress bar updates."""
     
+    POLL_INTERVAL_MS = 100
+    
     def __init__(self, progress_bar: ttk.Progressbar, master: tk.Widget):
         self.progress_bar = progress_bar
         self.master = master
+        self._value = 0
+        self._total = 0
+        self._applied_total = None
+        self._done = threading.Event()
+        self._done.set()
     
     def set_maximum(self, maximum: int) -> None:
         """Set the maximum value for the progress bar."""
         self.progress_bar['maximum'] = maximum
     
     def update(self, value: int) -> None:
-        """Update progress bar value safely."""
-        def _update():
-            try:
-                if self.master.winfo_exists():
-                    self.progress_bar['value'] = value
-            except tk.TclError:
-                pass
+        """Record a progress value (safe to call from worker threads)."""
+        self._value = value
+    
+    def set_total(self, total: int) -> None:
+        """Record the (possibly still growing) maximum (safe to call from worker threads)."""
+        self._total = total
+    
+    def start(self) -> None:
+        """Reset and start polling recorded values into the progress bar."""
+        self.reset()
+        self._done.clear()
+        self.master.after(self.POLL_INTERVAL_MS, self._poll)
+    
+    def finish(self) -> None:
+        """Signal that no more updates follow (safe to call from worker threads)."""
+        self._done.set()
+    
+    def _poll(self) -> None:
+        """Apply the latest value; reschedule until finish() was called."""
+        # Read the flag first so the final value is never missed
+        done = self._done.is_set()
+        try:
+            if not self.master.winfo_exists():
+                return
+            total = self._total
+            if total and total != self._applied_total:
+                self.progress_bar['maximum'] = total
+                self._applied_total = total
+            self.progress_bar['value'] = self._value
+        except tk.TclError:
+            return
         
-        self.master.after(0, _update)
+        if not done:
+            self.master.after(self.POLL_INTERVAL_MS, self._poll)
     
     def reset(self) -> None:
         """Reset progress bar to zero."""
-        self.update(0)
\ No newline at end of file
+        self._value = 0
+        self._total = 0
+        self._applied_total = None
+        try:
+            self.progress_bar['value'] = 0
+        except tk.TclError:
+            pass